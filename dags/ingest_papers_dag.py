@@ -5,8 +5,8 @@ This DAG orchestrates the daily ingestion of Agentic RAG papers:
 0. Initialize database and create tables
 1. Fetch metadata from Arxiv
 2. Check idempotency (filter existing papers)
-3. Download and parse PDFs in parallel (Dynamic Task Mapping)
-4. Store parsed content to PostgreSQL
+3. Download and parse PDFs concurrently in a single batched task
+4. Store parsed content to PostgreSQL in one bulk upsert
 5. Index papers to OpenSearch for keyword search (NEW - Phase 3)
 """
 import sys
@@ -24,7 +24,7 @@ from tasks.ingestion_tasks import (
     init_db_task,
     fetch_metadata_task,
     check_idempotency_task,
-    download_and_parse_task,
+    download_and_parse_all_task,
     store_to_db_task,
     index_papers_task
 )
@@ -80,21 +80,20 @@ with DAG(
         """Filter out papers that already exist in database"""
         return check_idempotency_task(papers=papers)
     
-    # Step 3: Download and parse PDFs (Dynamic Task Mapping)
+    # Step 3: Download and parse PDFs (one batched asyncio task)
     @task(
-            max_active_tis_per_dag=1,  # FORCE: Only 1 PDF parser runs at a time
             retries=3,
             retry_delay=timedelta(seconds=30)
         ) # type: ignore
-    def download_and_parse(paper):
-        """Download PDF and parse with Docling"""
-        return download_and_parse_task(paper=paper)
+    def download_and_parse_all(papers):
+        """Download all PDFs concurrently and parse with Docling"""
+        return download_and_parse_all_task(papers=papers)
     
-    # Step 4: Store to database (Dynamic Task Mapping)
+    # Step 4: Store to database (single bulk upsert)
     @task
-    def store_to_db(data):
-        """Store parsed content to PostgreSQL"""
-        return store_to_db_task(data=data)
+    def store_all_to_db(papers):
+        """Store all parsed papers to PostgreSQL"""
+        return store_to_db_task(papers=papers)
     
     # Step 5: Index papers to OpenSearch (PHASE 3 - NEW!)
     @task(
@@ -111,17 +110,16 @@ with DAG(
         dag=dag,
     )
     
-    # DAG flow with dynamic task mapping
+    # DAG flow
     db_ready = init_db()
     papers = fetch_metadata()
     new_papers = check_idempotency(papers)
     
-    # Dynamic Task Mapping: Create one task per paper
-    # .expand() creates parallel tasks for each item in the list
-    processed_data = download_and_parse.expand(paper=new_papers)
+    # Download and parse every new paper in one task (concurrent downloads)
+    processed_data = download_and_parse_all(new_papers)
     
-    # Store each processed paper to database in parallel
-    stored = store_to_db.expand(data=processed_data)
+    # Store all processed papers with one INSERT ... ON CONFLICT batch
+    stored = store_all_to_db(processed_data)
     
     # Index all papers to OpenSearch
     indexed = index_papers()
@@ -4,28 +4,119 @@ Airflow tasks for paper ingestion pipeline (Phase 2 Implementation)
 
 import os
 import json
-from pathlib import Path
-from typing import List, Dict, Any
 from datetime import datetime
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
 
 import arxiv
 import aiohttp
 import asyncio
 from loguru import logger
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.database.session import DatabaseSession
-from src.database.models import Paper
-from src.ingestion.parser import DoclingParser
+from src.database.models import Paper, utcnow
+from src.ingestion.parser import DoclingParser, create_parse_pool
+from src.utils.retry import backoff_delay, parse_retry_after
+
+# Max arxiv_ids per IN (...) clause, keeps bind parameters well below Postgres limits
+ID_LOOKUP_CHUNK_SIZE = 1000
+
+# Max rows per INSERT ... ON CONFLICT statement
+UPSERT_BATCH_SIZE = 500
+
+# Idempotent DDL for columns added or changed after a database was first created;
+# create_all() only creates missing tables, never alters them. Run in order by init_db_task.
+SCHEMA_UPGRADES = [
+    "ALTER TABLE papers ADD COLUMN IF NOT EXISTS authors JSONB",
+    "ALTER TABLE papers ADD COLUMN IF NOT EXISTS categories JSONB",
+    # sections_json was Text holding json.dumps() output; convert it once
+    """
+    DO $$
+    BEGIN
+        IF (
+            SELECT data_type FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = 'papers'
+              AND column_name = 'sections_json'
+        ) = 'text' THEN
+            ALTER TABLE papers ALTER COLUMN sections_json TYPE JSONB
+                USING CAST(NULLIF(sections_json, '') AS JSONB);
+        END IF;
+    END
+    $$
+    """,
+]
+
+# Papers per DB fetch and per OpenSearch _bulk request when indexing
+INDEX_BATCH_SIZE = 500
+
+# Default number of PDFs downloaded at once
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 5
+
+# Docling parse processes per task. Each one loads its own copy of the models
+# (roughly 1-2GB), so this stays at 1 unless the worker has memory to spare.
+DEFAULT_PARSE_WORKERS = max(1, int(os.getenv('QUANTA_PARSE_WORKERS', 1)))
+
+# Largest page arxiv's API is asked for in one request
+ARXIV_MAX_PAGE_SIZE = 100
+
+# Raw PDFs and parsed content (parsed text stays on disk, only its path goes through XCom)
+RAW_DATA_DIR = Path("data/raw")
+PARSED_DATA_DIR = Path("data/parsed")
+
+# Identifies the pipeline to arxiv.org
+HTTP_USER_AGENT = 'quanta-rag/1.0'
+
+# Bytes read from the socket per write when streaming PDFs to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# PDF download retries (arxiv throttles with 429/503)
+DOWNLOAD_MAX_ATTEMPTS = 5
+RETRYABLE_HTTP_STATUSES = {429, 500, 502, 503, 504}
+
+# Parse-pool failures that say nothing about the paper being parsed: a worker was
+# killed (e.g. OOM), the pool is shut down, or it cannot start processes (which
+# create_parse_pool avoids by parsing in-process from daemonic task processes).
+# Content errors never get this far, DoclingParser.parse_pdf handles them inside
+# the worker. These fail the task so Airflow retries it instead of storing the
+# whole batch with empty full_text.
+PARSE_POOL_ERRORS = (BrokenProcessPool, RuntimeError, AssertionError)
+
+
+def _fetch_existing_arxiv_ids(session, arxiv_ids: List[str]) -> Set[str]:
+    """
+    Look up which arxiv_ids are already stored, in one query per chunk
+
+    Args:
+        session: Active SQLAlchemy session
+        arxiv_ids: Candidate arxiv_ids
+
+    Returns:
+        Set of arxiv_ids that already exist in the database
+    """
+    existing = set()
+
+    for start in range(0, len(arxiv_ids), ID_LOOKUP_CHUNK_SIZE):
+        chunk = arxiv_ids[start:start + ID_LOOKUP_CHUNK_SIZE]
+        # Core select of a single column: no ORM row hydration
+        existing.update(session.execute(
+            select(Paper.arxiv_id).where(Paper.arxiv_id.in_(chunk))
+        ).scalars())
+
+    return existing
 
 
 def init_db_task(**kwargs) -> bool:
     """
-    Initialize database and create all tables
+    Initialize database, create all tables and apply SCHEMA_UPGRADES
     
     This task MUST run before any other database operations
-    to ensure the 'papers' table exists.
+    to ensure the 'papers' table exists with every current column.
     
     Args:
         **kwargs: Airflow context
@@ -38,7 +129,12 @@ def init_db_task(**kwargs) -> bool:
     try:
         DatabaseSession.initialize()
         DatabaseSession.create_tables()
-        logger.info("Database initialized successfully - tables created")
+        
+        with DatabaseSession.session_scope() as session:
+            for statement in SCHEMA_UPGRADES:
+                session.execute(text(statement))
+        
+        logger.info("Database initialized successfully - tables created and upgraded")
         return True
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -61,6 +157,9 @@ def fetch_metadata_task(query: str = "Agentic RAG", max_results: int = 5, **kwar
     logger.info(f"Fetching papers: query='{query}', max_results={max_results}")
     
     try:
+        # Only request as many entries per API page as we need (arxiv pages 100 by default)
+        client = arxiv.Client(page_size=max(1, min(max_results, ARXIV_MAX_PAGE_SIZE)))
+
         # Search Arxiv for Quantum Computing papers
         search = arxiv.Search(
             query=query,
@@ -68,18 +167,18 @@ def fetch_metadata_task(query: str = "Agentic RAG", max_results: int = 5, **kwar
             sort_by=arxiv.SortCriterion.SubmittedDate
         )
         
-        papers = []
-        for result in search.results():
-            paper_data = {
-                'arxiv_id': result.entry_id.split('/')[-1],
+        papers = [
+            {
+                'arxiv_id': result.entry_id.rsplit('/', 1)[-1],
                 'title': result.title,
                 'summary': result.summary,
-                'published_date': result.published.isoformat(),
+                'published_date': result.published,  # datetime, serialized natively by XCom
                 'pdf_url': result.pdf_url,
                 'authors': [author.name for author in result.authors],
                 'categories': result.categories,
             }
-            papers.append(paper_data)
+            for result in client.results(search)
+        ]
         
         logger.info(f"Fetched {len(papers)} Quantum Computing papers")
         
@@ -106,26 +205,24 @@ def check_idempotency_task(papers: List[Dict[str, Any]] = None, **kwargs) -> Lis
         return []
     
     logger.info(f"Checking idempotency for {len(papers)} papers")
-    
+
     # Initialize database
     DatabaseSession.initialize()
-    
-    new_papers = []
-    
+
     with DatabaseSession.session_scope() as session:
-        for paper_data in papers:
-            arxiv_id = paper_data['arxiv_id']
-            
-            # Check if paper already exists
-            existing_paper = session.query(Paper).filter_by(
-                arxiv_id=arxiv_id
-            ).first()
-            
-            if existing_paper:
-                logger.debug(f"Paper already exists: {arxiv_id}")
-            else:
-                logger.debug(f"New paper found: {arxiv_id}")
-                new_papers.append(paper_data)
+        existing_ids = _fetch_existing_arxiv_ids(
+            session, [paper_data['arxiv_id'] for paper_data in papers]
+        )
+
+    new_papers = []
+    for paper_data in papers:
+        arxiv_id = paper_data['arxiv_id']
+
+        if arxiv_id in existing_ids:
+            logger.debug("Paper already exists: {}", arxiv_id)
+        else:
+            logger.debug("New paper found: {}", arxiv_id)
+            new_papers.append(paper_data)
     
     logger.info(
         f"Idempotency check complete: {len(new_papers)} new papers, "
@@ -135,136 +232,421 @@ def check_idempotency_task(papers: List[Dict[str, Any]] = None, **kwargs) -> Lis
     return new_papers
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10),
-    reraise=True
-)
-def download_and_parse_task(paper: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+def _write_parsed_content(arxiv_id: str, parsed_content: Dict[str, Any]) -> Path:
     """
-    Download PDF and parse with Docling (with retries)
-    
+    Persist parsed full_text and sections so they don't travel through XCom
+
+    Args:
+        arxiv_id: Arxiv paper ID
+        parsed_content: Output of DoclingParser.parse_pdf
+
+    Returns:
+        Path of the written JSON file
+    """
+    parsed_path = PARSED_DATA_DIR / f"{arxiv_id}.json"
+    parsed_path.write_text(json.dumps({
+        'full_text': parsed_content['full_text'],
+        'sections': parsed_content['sections'],
+    }))
+    return parsed_path
+
+
+def _load_parsed_content(parsed_path: str = None) -> Dict[str, Any]:
+    """
+    Load parsed content written by _write_parsed_content
+
     Args:
+        parsed_path: Path of the parsed JSON file (None if parsing failed)
+
+    Returns:
+        Dictionary with 'full_text' and 'sections'
+    """
+    if not parsed_path:
+        return {'full_text': '', 'sections': []}
+
+    return json.loads(Path(parsed_path).read_text())
+
+
+async def _download_pdf(session: aiohttp.ClientSession, url: str, pdf_path: Path) -> int:
+    """
+    Stream a single PDF to disk, retrying transient failures
+
+    Chunks are written to a '.part' file that is renamed into place only
+    once the download completes, so a partial file never passes the
+    "PDF already exists" check. Connection errors, timeouts and HTTP
+    429/5xx are retried with exponential backoff and jitter, honouring
+    Retry-After when arxiv sends it.
+
+    Args:
+        session: Shared aiohttp session
+        url: PDF URL
+        pdf_path: Destination path
+
+    Returns:
+        Number of bytes written
+    """
+    tmp_path = pdf_path.with_suffix('.pdf.part')
+
+    try:
+        for attempt in range(1, DOWNLOAD_MAX_ATTEMPTS + 1):
+            try:
+                async with session.get(url) as response:
+                    if response.status in RETRYABLE_HTTP_STATUSES and attempt < DOWNLOAD_MAX_ATTEMPTS:
+                        delay = parse_retry_after(response.headers.get('Retry-After')) or backoff_delay(attempt)
+                        reason = f"HTTP {response.status}"
+                    else:
+                        response.raise_for_status()
+
+                        size = 0
+                        with open(tmp_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                size += len(chunk)
+
+                        os.replace(tmp_path, pdf_path)
+                        return size
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Non-retryable HTTP statuses and the final attempt propagate
+                if isinstance(e, aiohttp.ClientResponseError) or attempt == DOWNLOAD_MAX_ATTEMPTS:
+                    raise
+                delay = backoff_delay(attempt)
+                reason = repr(e)
+
+            logger.warning(
+                f"Download of {url} failed ({reason}), attempt {attempt}/{DOWNLOAD_MAX_ATTEMPTS}; "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+async def _fetch_paper_pdf(session: aiohttp.ClientSession, paper: Dict[str, Any], pdf_path: Path) -> None:
+    """
+    Download stage: make sure a paper's PDF is on disk
+
+    Args:
+        session: Shared aiohttp session
         paper: Single paper metadata dictionary
-        **kwargs: Airflow context
-    
+        pdf_path: Destination path
+    """
+    arxiv_id = paper['arxiv_id']
+
+    if pdf_path.exists():
+        logger.debug("PDF already exists: {}", arxiv_id)
+        return
+
+    logger.info(f"Downloading PDF: {arxiv_id}")
+    size = await _download_pdf(session, paper['pdf_url'], pdf_path)
+    logger.info(f"Downloaded: {arxiv_id} ({size} bytes)")
+
+
+async def _parse_paper(executor: Executor, paper: Dict[str, Any], pdf_path: Path) -> Dict[str, Any]:
+    """
+    Parse stage: parse a downloaded PDF off the event loop and persist the content
+
+    Args:
+        executor: Parse pool from create_parse_pool()
+        paper: Single paper metadata dictionary
+        pdf_path: Downloaded PDF
+
     Returns:
-        Paper data with parsed content
+        Paper metadata plus 'pdf_path' and 'parsed_path' (parsed content file)
     """
     arxiv_id = paper['arxiv_id']
-    logger.info(f"Processing paper: {arxiv_id}")
-    
-    # Setup paths
-    data_dir = Path("data/raw")
-    data_dir.mkdir(parents=True, exist_ok=True)
-    pdf_path = data_dir / f"{arxiv_id}.pdf"
-    
+
+    logger.info(f"Parsing PDF with Docling: {arxiv_id}")
+    parsed_content = await DoclingParser.parse_pdf_async(str(pdf_path), executor)
+
+    logger.info(
+        f"Parsed {arxiv_id}: {len(parsed_content['full_text'])} chars, "
+        f"{len(parsed_content['sections'])} sections"
+    )
+
+    # Keep bulky content on disk, pass only its path downstream.
+    # Serializing MBs of text is blocking work, so keep it off the event loop.
+    parsed_path = await asyncio.to_thread(_write_parsed_content, arxiv_id, parsed_content)
+
+    return {
+        **paper,  # Original metadata
+        'pdf_path': str(pdf_path),
+        'parsed_path': str(parsed_path),
+        'parse_metadata': parsed_content['metadata']
+    }
+
+
+def _failed_result(paper: Dict[str, Any], pdf_path: Path, error: Exception) -> Dict[str, Any]:
+    """Paper data for a download or parse failure (stored with empty content)"""
+    logger.error(f"Error processing {paper['arxiv_id']}: {error}")
+    return {
+        **paper,
+        'pdf_path': str(pdf_path) if pdf_path.exists() else None,
+        'parsed_path': None,
+        'parse_metadata': {'error': str(error)}
+    }
+
+
+def _create_http_session(max_concurrent: int) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session tuned for arxiv.org PDF downloads
+
+    Must be called from inside a running event loop. The session owns the
+    connection pool and timeouts, so requests made with it need no
+    per-call timeout.
+
+    Args:
+        max_concurrent: Maximum concurrent PDF downloads
+
+    Returns:
+        aiohttp ClientSession (caller closes it)
+    """
+    # Keep-alive pool sized to the download concurrency, with cached DNS for arxiv.org
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=max_concurrent,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+    # No overall cap for large streamed PDFs; a stalled socket still aborts
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={'User-Agent': HTTP_USER_AGENT}
+    )
+
+
+async def _download_and_parse_all(
+    papers: List[Dict[str, Any]],
+    max_concurrent: int,
+    max_parse_workers: int,
+    session: Optional[aiohttp.ClientSession] = None
+) -> List[Dict[str, Any]]:
+    """
+    Download and parse papers as a two-stage pipeline
+
+    max_concurrent download workers feed a bounded queue drained by
+    max_parse_workers parse workers (see create_parse_pool). A paper is
+    parsed as soon as its PDF lands, and downloads never wait on parsing
+    unless the parse queue is full.
+
+    Args:
+        papers: List of paper metadata
+        max_concurrent: Maximum concurrent PDF downloads
+        max_parse_workers: Parse workers
+        session: Existing session to reuse (a new one is created and closed if omitted)
+
+    Returns:
+        List of paper metadata with 'pdf_path' and 'parsed_path' added
+        (one entry per distinct arxiv_id)
+
+    Raises:
+        BrokenProcessPool, RuntimeError, AssertionError: The parse pool
+            itself failed; no partial results are returned
+    """
+    # One pipeline pass per arxiv_id: duplicates would race on the same PDF and
+    # parsed-content paths, and store_to_db_task keeps only one row per ID anyway
+    unique_papers: Dict[str, Dict[str, Any]] = {}
+    for paper in papers:
+        unique_papers.setdefault(paper['arxiv_id'], paper)
+    if len(unique_papers) < len(papers):
+        logger.warning(f"Skipping {len(papers) - len(unique_papers)} duplicate arxiv_ids in batch")
+    papers = list(unique_papers.values())
+
+    RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    PARSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(papers)
+
+    download_queue: asyncio.Queue = asyncio.Queue()
+    for index, paper in enumerate(papers):
+        download_queue.put_nowait((index, paper))
+
+    # Bounded: downloads run at most a couple of PDFs ahead of the parsers
+    parse_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * max_parse_workers)
+
+    owns_session = session is None
+    if owns_session:
+        session = _create_http_session(max_concurrent)
+
+    async def download_worker() -> None:
+        while not download_queue.empty():
+            index, paper = download_queue.get_nowait()
+            pdf_path = RAW_DATA_DIR / f"{paper['arxiv_id']}.pdf"
+            try:
+                await _fetch_paper_pdf(session, paper, pdf_path)
+            except Exception as e:
+                results[index] = _failed_result(paper, pdf_path, e)
+                continue
+            await parse_queue.put((index, paper, pdf_path))
+
+    async def parse_worker(executor: Executor) -> None:
+        while True:
+            item = await parse_queue.get()
+            if item is None:
+                return
+            index, paper, pdf_path = item
+            try:
+                results[index] = await _parse_paper(executor, paper, pdf_path)
+            except PARSE_POOL_ERRORS:
+                raise
+            except Exception as e:
+                results[index] = _failed_result(paper, pdf_path, e)
+
     try:
-        # Step 1: Download PDF if not exists
-        if not pdf_path.exists():
-            logger.info(f"Downloading PDF: {arxiv_id}")
-            
-            import requests
-            response = requests.get(paper['pdf_url'], timeout=30)
-            response.raise_for_status()
-            
-            pdf_path.write_bytes(response.content)
-            logger.info(f"Downloaded: {arxiv_id} ({len(response.content)} bytes)")
-        else:
-            logger.debug(f"PDF already exists: {arxiv_id}")
-        
-        # Step 2: Parse PDF with Docling
-        logger.info(f"Parsing PDF with Docling: {arxiv_id}")
-        parser = DoclingParser()
-        parsed_content = parser.parse_pdf(str(pdf_path))
-        
-        # Step 3: Combine metadata and parsed content
-        result = {
-            **paper,  # Original metadata
-            'pdf_path': str(pdf_path),
-            'full_text': parsed_content['full_text'],
-            'sections': parsed_content['sections'],
-            'parse_metadata': parsed_content['metadata']
-        }
-        
-        logger.info(
-            f"Parsed {arxiv_id}: {len(parsed_content['full_text'])} chars, "
-            f"{len(parsed_content['sections'])} sections"
-        )
-        
-        return result
-        
-    except Exception as e:
-        logger.error(f"Error processing {arxiv_id}: {e}")
-        # Return paper with empty content on failure
-        return {
-            **paper,
-            'pdf_path': str(pdf_path) if pdf_path.exists() else None,
-            'full_text': '',
-            'sections': [],
-            'parse_metadata': {'error': str(e)}
-        }
-
-
-def store_to_db_task(data: Dict[str, Any], **kwargs) -> bool:
+        # Each parse worker loads its Docling models once, up front
+        with create_parse_pool(max_parse_workers) as executor:
+            downloaders = [
+                asyncio.create_task(download_worker())
+                for _ in range(min(len(papers), max_concurrent))
+            ]
+            parsers = [
+                asyncio.create_task(parse_worker(executor))
+                for _ in range(max_parse_workers)
+            ]
+
+            async def stop_parsers_after_downloads() -> None:
+                await asyncio.gather(*downloaders)
+                # Downloads done: one stop marker per parse worker
+                for _ in parsers:
+                    await parse_queue.put(None)
+
+            try:
+                # A pool failure in any parse worker propagates at once; the
+                # downloads must not be left waiting on a parse queue nobody drains
+                await asyncio.gather(stop_parsers_after_downloads(), *parsers)
+            finally:
+                for worker_task in (*downloaders, *parsers):
+                    worker_task.cancel()
+                await asyncio.gather(*downloaders, *parsers, return_exceptions=True)
+    finally:
+        if owns_session:
+            await session.close()
+
+    return results
+
+
+def download_and_parse_all_task(
+    papers: List[Dict[str, Any]] = None,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    max_parse_workers: int = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Download and parse all new papers in a single task
+
+    Downloads run concurrently with asyncio and feed a queue of Docling
+    parse workers, so parsing overlaps with the remaining downloads. One
+    worker parses in-process on a thread; more use a process pool (and
+    several cores) where the task process is allowed to start children.
+
+    Args:
+        papers: List of new paper metadata from check_idempotency_task
+        max_concurrent: Maximum concurrent PDF downloads
+        max_parse_workers: Parse workers (defaults to QUANTA_PARSE_WORKERS,
+            capped at the number of papers; each one holds its own Docling models)
+        **kwargs: Airflow context
+
+    Returns:
+        List of paper metadata with 'pdf_path' and 'parsed_path' added
+    """
+    if not papers:
+        logger.warning("No papers to download")
+        return []
+
+    # At least one parse worker, or nothing would drain the parse queue
+    max_parse_workers = max(1, min(max_parse_workers or DEFAULT_PARSE_WORKERS, len(papers)))
+
+    logger.info(
+        f"Downloading and parsing {len(papers)} papers "
+        f"(max_concurrent={max_concurrent}, max_parse_workers={max_parse_workers})"
+    )
+
+    results = asyncio.run(_download_and_parse_all(papers, max_concurrent, max_parse_workers))
+
+    failed = sum(1 for result in results if 'error' in result['parse_metadata'])
+    logger.info(f"Processed {len(results)} papers ({failed} failed)")
+
+    return results
+
+
+def _build_paper_row(data: Dict[str, Any], ingested_at: datetime) -> Dict[str, Any]:
+    """
+    Map processed paper data onto 'papers' table columns
+
+    Args:
+        data: Paper data from download_and_parse_all_task
+        ingested_at: Shared created_at timestamp for the batch
+
+    Returns:
+        Column-name to value dictionary for a bulk INSERT
+    """
+    parsed_content = _load_parsed_content(data.get('parsed_path'))
+
+    return {
+        'arxiv_id': data['arxiv_id'],
+        'title': data['title'],
+        'summary': data.get('summary'),
+        'authors': data.get('authors') or [],
+        'categories': data.get('categories') or [],
+        'pdf_path': data.get('pdf_path'),
+        'full_text': parsed_content['full_text'],
+        'sections_json': parsed_content['sections'],
+        'published_date': data['published_date'],
+        'created_at': ingested_at,
+    }
+
+
+def store_to_db_task(papers: List[Dict[str, Any]] = None, **kwargs) -> bool:
     """
     Store paper metadata and parsed content to PostgreSQL
-    
+
+    Uses a single INSERT ... ON CONFLICT (arxiv_id) DO UPDATE per batch
+    instead of a SELECT + INSERT/UPDATE round trip per paper.
+
     Args:
-        data: Paper data with parsed content
+        papers: List of paper data from download_and_parse_all_task
         **kwargs: Airflow context
-    
+
     Returns:
         True if successful
     """
-    arxiv_id = data['arxiv_id']
-    logger.info(f"Storing to database: {arxiv_id}")
-    
-    # Initialize database
+    if not papers:
+        logger.warning("No papers to store")
+        return True
+
+    # Deduplicate on arxiv_id: a single ON CONFLICT statement cannot touch a row twice
+    ingested_at = utcnow()
+    rows = list({paper['arxiv_id']: _build_paper_row(paper, ingested_at) for paper in papers}.values())
+    logger.info(f"Storing {len(rows)} papers to database")
+
+    # Initialize database (tables are created once by init_db_task)
     DatabaseSession.initialize()
-    DatabaseSession.create_tables()
-    
+
     try:
         with DatabaseSession.session_scope() as session:
-            # Check if paper exists
-            existing_paper = session.query(Paper).filter_by(
-                arxiv_id=arxiv_id
-            ).first()
-            
-            # Convert sections to JSON string
-            sections_json = json.dumps(data.get('sections', []))
-            
-            if existing_paper:
-                # Update existing paper
-                existing_paper.title = data['title']
-                existing_paper.summary = data.get('summary')
-                existing_paper.pdf_path = data.get('pdf_path')
-                existing_paper.full_text = data.get('full_text')
-                existing_paper.sections_json = sections_json
-                existing_paper.published_date = datetime.fromisoformat(
-                    data['published_date']
-                )
-                logger.info(f"Updated existing paper: {arxiv_id}")
-            else:
-                # Insert new paper
-                new_paper = Paper(
-                    arxiv_id=arxiv_id,
-                    title=data['title'],
-                    summary=data.get('summary'),
-                    pdf_path=data.get('pdf_path'),
-                    full_text=data.get('full_text'),
-                    sections_json=sections_json,
-                    published_date=datetime.fromisoformat(
-                        data['published_date']
-                    ),
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                batch = rows[start:start + UPSERT_BATCH_SIZE]
+
+                stmt = pg_insert(Paper).values(batch)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['arxiv_id'],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in batch[0]
+                        if column not in ('arxiv_id', 'created_at')  # Keep first-ingest time
+                    }
                 )
-                session.add(new_paper)
-                logger.info(f"Inserted new paper: {arxiv_id}")
-        
+                session.execute(stmt)
+
+        logger.info(f"Upserted {len(rows)} papers")
         return True
-        
+
     except Exception as e:
-        logger.error(f"Error storing {arxiv_id}: {e}")
+        logger.error(f"Error storing papers {[row['arxiv_id'] for row in rows]}: {e}")
         raise
 
 
@@ -277,34 +659,49 @@ def index_papers_task(**kwargs):
     search_client = QuantaSearchClient()
     DatabaseSession.initialize()
     
-    paper_list = []
-    
     # 1. Open Session and fetch data
     with DatabaseSession.session_scope() as session:
-        papers = session.query(Paper).all()
+        # Plain SELECT count(*); Query.count() wraps the query in a subselect
+        total = session.execute(select(func.count()).select_from(Paper)).scalar()
+        
+        if not total:
+            logger.warning("No papers found in DB to index.")
+            return "No data"
         
-        # 2. IMMEDIATELY convert to dictionaries while session is active
-        # This prevents DetachedInstanceError
-        for paper in papers:
-            paper_list.append({
-                "arxiv_id": paper.arxiv_id,
-                "title": paper.title,
-                "summary": paper.summary,
-                "full_text": paper.full_text,
-                "published_date": paper.published_date.isoformat() if paper.published_date else None
-            })
+        # 2. Stream plain column rows through a server-side cursor, INDEX_BATCH_SIZE
+        # at a time, so full_text for the whole table is never held in memory.
+        # Column rows are not ORM objects, so no DetachedInstanceError either.
+        rows = session.query(
+            Paper.arxiv_id,
+            Paper.title,
+            Paper.summary,
+            Paper.authors,
+            Paper.categories,
+            Paper.full_text,
+            Paper.published_date
+        ).yield_per(INDEX_BATCH_SIZE)
+        
+        paper_stream = (
+            {
+                "arxiv_id": row.arxiv_id,
+                "title": row.title,
+                "summary": row.summary,
+                "authors": row.authors or [],  # NULL for papers stored before the column existed
+                "categories": row.categories or [],
+                "full_text": row.full_text,
+                "published_date": row.published_date  # Encoded as ISO-8601 by the client's serializer
+            }
+            for row in rows
+        )
+        
+        # 3. The bulk helper pulls from the stream chunk by chunk, so DB reads
+        # overlap with _bulk requests already in flight
+        indexed = search_client.upsert_papers(paper_stream)
     
-    # 3. Now that the session is closed, the 'paper_list' is safe to use
-    if not paper_list:
-        logger.warning("No papers found in DB to index.")
-        return "No data"
-
-    for paper_data in paper_list:
-        try:
-            search_client.upsert_paper(paper_data)
-        except Exception as e:
-            logger.error(f"Failed to index {paper_data['arxiv_id']}: {e}")
-            raise e
-
-    logger.success(f"Successfully indexed {len(paper_list)} papers to OpenSearch.")
-    return f"Indexed {len(paper_list)} papers"
+    if indexed < total:
+        raise RuntimeError(
+            f"Indexed only {indexed} of {total} papers to OpenSearch"
+        )
+
+    logger.success(f"Successfully indexed {indexed} papers to OpenSearch.")
+    return f"Indexed {indexed} papers"
@@ -2,13 +2,24 @@
 SQLAlchemy models for Quanta-RAG PostgreSQL database
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime
+    
+    Replacement for the deprecated datetime.utcnow(); the DateTime
+    columns store naive UTC values.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Paper(Base):
     """
     Paper metadata model
@@ -26,21 +37,22 @@ class Paper(Base):
     # Paper metadata
     title = Column(String(500), nullable=False)
     summary = Column(Text, nullable=True)
+    authors = Column(JSONB, nullable=True)  # List of author names
+    categories = Column(JSONB, nullable=True)  # List of arxiv category codes
     
     # File storage
     pdf_path = Column(String(500), nullable=True)
     
     # Parsed content (Phase 2)
     full_text = Column(Text, nullable=True)
-    sections_json = Column(Text, nullable=True)  # JSON string of sections
+    sections_json = Column(JSONB, nullable=True)  # List of section dicts
     
     # Temporal metadata
     published_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
     
-    # Indexes for common queries
+    # Indexes for common queries (arxiv_id is already indexed via unique=True, index=True)
     __table_args__ = (
-        Index('idx_arxiv_id', 'arxiv_id'),
         Index('idx_published_date', 'published_date'),
         Index('idx_created_at', 'created_at'),
     )
@@ -55,6 +67,8 @@ class Paper(Base):
             'arxiv_id': self.arxiv_id,
             'title': self.title,
             'summary': self.summary,
+            'authors': self.authors,
+            'categories': self.categories,
             'pdf_path': self.pdf_path,
             'full_text': self.full_text,
             'sections_json': self.sections_json,
@@ -20,6 +20,7 @@ load_dotenv()
 class DatabaseSession:
     """
     PostgreSQL session manager with connection pooling
+    (NullPool inside short-lived Airflow task processes)
     """
     
     _engine = None
@@ -30,11 +31,13 @@ class DatabaseSession:
         """
         Initialize database engine and session factory
         
+        Safe to call from every task: the engine is built once per process
+        and later calls return immediately, reusing its connection pool.
+        
         Args:
             database_url: PostgreSQL connection URL
         """
         if cls._engine is not None:
-            logger.warning("Database already initialized")
             return
         
         # Get database URL from environment or parameter
@@ -45,14 +48,26 @@ class DatabaseSession:
         
         logger.info(f"Initializing database connection: {db_url.split('@')[-1]}")
         
+        # Airflow exports AIRFLOW_CTX_* variables while a task callable runs.
+        # Task processes are short-lived, so a pool would only hold idle
+        # Postgres backends open; long-running processes keep a real pool.
+        if os.getenv('AIRFLOW_CTX_TASK_ID'):
+            pool_kwargs = {'poolclass': NullPool}
+        else:
+            pool_kwargs = {
+                'pool_pre_ping': True,  # Verify connections before using
+                'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),  # Replace stale connections
+                'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),  # Fail fast when the pool is exhausted
+                'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+                'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+            }
+        
         try:
-            # Create engine with connection pooling
+            # Create engine (pooled outside Airflow tasks)
             cls._engine = create_engine(
                 db_url,
-                pool_pre_ping=True,  # Verify connections before using
-                pool_size=10,
-                max_overflow=20,
-                echo=False  # Set to True for SQL debugging
+                echo=False,  # Set to True for SQL debugging
+                **pool_kwargs
             )
             
             # Create session factory
@@ -3,12 +3,90 @@ Docling-based PDF parser for Quanta-RAG
 Extracts structured text from scientific papers
 """
 
+import io
+import os
 import json
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from loguru import logger
 
 
+@functools.lru_cache(maxsize=1)
+def _get_converter():
+    """
+    Import Docling and build its converter once per process
+    
+    Returns:
+        Shared DocumentConverter, or None if Docling is unavailable
+    """
+    try:
+        from docling.document_converter import DocumentConverter
+        converter = DocumentConverter()
+        logger.info("Docling DocumentConverter initialized successfully")
+        return converter
+    except ImportError as e:
+        logger.error(f"Failed to import Docling: {e}")
+        logger.warning("Falling back to simple text extraction")
+        return None
+
+
+# Parser shared by parse_pdf_safe() callers and parse pool workers in this process
+_parser: Optional["DoclingParser"] = None
+
+
+def _get_parser() -> "DoclingParser":
+    """Get this process's shared DoclingParser, creating it on first use"""
+    global _parser
+    if _parser is None:
+        _parser = DoclingParser()
+    return _parser
+
+
+def _init_parse_worker() -> None:
+    """Pool initializer: build this worker's parser and load Docling models once"""
+    _get_parser()
+    _get_converter()
+
+
+def create_parse_pool(workers: Optional[int] = None) -> Executor:
+    """
+    Create an executor for CPU-bound PDF parsing
+    
+    Each worker builds one DoclingParser up front and reuses it for
+    every PDF it receives. A single worker parses in this process on one
+    thread (no child process, nothing pickled). Several workers use a
+    process pool, unless this process is daemonic (e.g. an Airflow
+    LocalExecutor task) and may not start children; then parsing falls
+    back to the single in-process thread.
+    
+    Args:
+        workers: Number of parse workers (defaults to CPU count)
+    
+    Returns:
+        Executor (caller shuts it down)
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    
+    if workers > 1 and multiprocessing.current_process().daemon:
+        logger.warning(
+            f"Daemonic process cannot start {workers} parse processes; "
+            f"parsing in-process on one thread instead"
+        )
+        workers = 1
+    
+    if workers == 1:
+        return ThreadPoolExecutor(max_workers=1, initializer=_init_parse_worker)
+    
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parse_worker
+    )
+
+
 class DoclingParser:
     """
     Advanced PDF parser using Docling
@@ -16,15 +94,12 @@ class DoclingParser:
     """
     
     def __init__(self):
-        """Initialize Docling parser"""
-        try:
-            from docling.document_converter import DocumentConverter
-            self.converter = DocumentConverter()
-            logger.info("DoclingParser initialized successfully")
-        except ImportError as e:
-            logger.error(f"Failed to import Docling: {e}")
-            logger.warning("Falling back to simple text extraction")
-            self.converter = None
+        """Initialize Docling parser (the converter is loaded on first parse)"""
+    
+    @property
+    def converter(self):
+        """Process-wide Docling converter, built on first access"""
+        return _get_converter()
     
     def parse_pdf(self, pdf_path: str) -> Dict[str, any]:
         """
@@ -56,6 +131,41 @@ class DoclingParser:
         # Fallback to simple extraction
         return self._parse_with_fallback(pdf_file)
     
+    @staticmethod
+    def parse_many(pdf_paths: List[str], workers: Optional[int] = None) -> List[Dict[str, any]]:
+        """
+        Parse several PDFs in parallel across processes
+        
+        Args:
+            pdf_paths: Paths to PDF files
+            workers: Number of worker processes (defaults to CPU count)
+        
+        Returns:
+            Parsed content dictionaries, in the same order as pdf_paths
+        """
+        if not pdf_paths:
+            return []
+        
+        workers = min(workers or os.cpu_count() or 1, len(pdf_paths))
+        
+        with create_parse_pool(workers) as pool:
+            return list(pool.map(parse_pdf_safe, pdf_paths))
+    
+    @staticmethod
+    async def parse_pdf_async(pdf_path: str, executor: Executor) -> Dict[str, any]:
+        """
+        Parse a PDF in a parse pool without blocking the event loop
+        
+        Args:
+            pdf_path: Path to PDF file
+            executor: Pool from create_parse_pool()
+        
+        Returns:
+            Parsed content dictionary
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, parse_pdf_safe, pdf_path)
+    
     def _parse_with_docling(self, pdf_file: Path) -> Dict[str, any]:
         """
         Parse PDF using Docling (preserves structure)
@@ -73,9 +183,10 @@ class DoclingParser:
         
         # Extract sections with structure
         sections = []
-        full_text_parts = []
+        full_text = io.StringIO()
+        element_count = 0
         
-        # Iterate through document elements
+        # Iterate through document elements (single pass)
         for item in result.document.iterate_items():
             # Get element text and type
             text = item.text if hasattr(item, 'text') else str(item)
@@ -89,10 +200,13 @@ class DoclingParser:
                     'level': getattr(item, 'level', 1)
                 })
             
-            # Add all text to full_text
-            full_text_parts.append(text)
+            # Add all text to full_text, separated by blank lines
+            if element_count:
+                full_text.write('\n\n')
+            full_text.write(text)
+            element_count += 1
         
-        full_text = '\n\n'.join(full_text_parts)
+        full_text = full_text.getvalue()
         
         logger.info(
             f"Docling extraction complete: {len(full_text)} chars, "
@@ -105,7 +219,7 @@ class DoclingParser:
             'metadata': {
                 'parser': 'docling',
                 'page_count': len(result.document.pages) if hasattr(result.document, 'pages') else 0,
-                'element_count': len(list(result.document.iterate_items()))
+                'element_count': element_count
             }
         }
     
@@ -168,14 +282,16 @@ def parse_pdf_safe(pdf_path: str) -> Dict[str, any]:
     """
     Convenience function for safe PDF parsing
     
+    Reuses one parser per process, so it is also the task run by parse
+    pool workers.
+    
     Args:
         pdf_path: Path to PDF file
     
     Returns:
         Parsed content dictionary
     """
-    parser = DoclingParser()
-    return parser.parse_pdf(pdf_path)
+    return _get_parser().parse_pdf(pdf_path)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,46 @@ Handles indexing and searching of research papers with automatic bootstrapping
 
 import os
 import time
-from typing import List, Dict, Any, Optional
+from urllib.parse import unquote, urlparse
+from typing import Iterable, List, Dict, Any, Optional
 from loguru import logger
 from dotenv import load_dotenv
 
+from src.services.opensearch.index_config import (
+    get_bulk_load_settings,
+    get_steady_state_settings,
+)
+from src.utils.retry import backoff_delay
+
 load_dotenv()
 
+# Seconds an index existence check is trusted before asking the cluster again
+INDEX_CACHE_TTL = 300
+
+# Bulk indexing defaults: sender threads and documents per _bulk request. Threads are
+# capped at 4 by default: os.cpu_count() is the host's core count inside a container,
+# and each thread can have ~3 chunks in flight, which would exceed a small node's
+# indexing_pressure limit (10% of heap) and get 429s. QUANTA_BULK_THREADS overrides.
+BULK_THREADS = int(os.getenv('QUANTA_BULK_THREADS', min(os.cpu_count() or 1, 4)))
+BULK_CHUNK_SIZE = int(os.getenv('QUANTA_BULK_CHUNK', 500))
+# Byte cap per _bulk request; 10MiB is the smallest request limit managed
+# OpenSearch offerings enforce, and keeps full-text chunks far from heap limits
+BULK_MAX_CHUNK_BYTES = int(os.getenv('QUANTA_BULK_MAX_BYTES', 10 * 1024 * 1024))
+
+# Keep-alive connections per host; at least one per bulk sender thread
+HTTP_POOL_MAXSIZE = max(int(os.getenv('OPENSEARCH_POOL_MAXSIZE', 32)), BULK_THREADS)
+
+# Static parts of the BM25 search body, built once and shared (read-only) by
+# every request; search() only fills in the per-request values
+DEFAULT_SEARCH_FIELDS = ['title^3', 'summary^2', 'full_text']
+SEARCH_SOURCE_FIELDS = ['arxiv_id', 'title', 'summary', 'published_date', 'authors']
+MULTI_MATCH_OPTIONS = {
+    "type": "best_fields",  # BM25 scoring
+    "tie_breaker": 0.3,  # Credit matches in the non-best fields too
+    "operator": "or",
+    "minimum_should_match": "2<70%"  # Short queries: all terms; longer: 70%
+}
+
 
 class QuantaSearchClient:
     """
@@ -29,31 +63,41 @@ class QuantaSearchClient:
         self.host = host or os.getenv('OPENSEARCH_HOST', 'http://localhost:9200')
         self.max_retries = max_retries
         self.client = None
+        # index name -> time.monotonic() of the last confirmed existence
+        self._known_indices: Dict[str, float] = {}
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize OpenSearch connection with retries"""
         for attempt in range(1, self.max_retries + 1):
             try:
-                from opensearchpy import OpenSearch
+                from opensearchpy import OpenSearch, Urllib3HttpConnection
+                from src.services.opensearch.serializer import OrjsonSerializer
                 
-                # Parse host URL
-                if self.host.startswith('http://') or self.host.startswith('https://'):
-                    host_parts = self.host.replace('http://', '').replace('https://', '').split(':')
-                    host_name = host_parts[0]
-                    host_port = int(host_parts[1]) if len(host_parts) > 1 else 9200
-                else:
-                    host_name = self.host
-                    host_port = 9200
+                # Parse host URL (scheme-less hosts are treated as plain HTTP)
+                url = urlparse(self.host if '://' in self.host else f'http://{self.host}')
+                use_ssl = url.scheme == 'https'
+                host_name = url.hostname
+                host_port = url.port or (443 if use_ssl else 9200)
+                http_auth = (unquote(url.username), unquote(url.password or '')) if url.username else None
+                
+                # Keep any path (e.g. a reverse proxy mount like https://proxy/opensearch)
+                host = {'host': host_name, 'port': host_port}
+                url_prefix = url.path.rstrip('/')
+                if url_prefix:
+                    host['url_prefix'] = url_prefix
                 
                 self.client = OpenSearch(
-                    hosts=[{'host': host_name, 'port': host_port}],
+                    hosts=[host],
+                    http_auth=http_auth,
                     http_compress=True,
-                    use_ssl=False,
-                    verify_certs=False,
-                    ssl_assert_hostname=False,
+                    serializer=OrjsonSerializer(),  # Faster encoding of large bulk bodies
+                    connection_class=Urllib3HttpConnection,
+                    maxsize=HTTP_POOL_MAXSIZE,  # urllib3 default of 10 starves parallel_bulk
+                    use_ssl=use_ssl,
+                    verify_certs=use_ssl,
                     ssl_show_warn=False,
-                    timeout=30,
+                    timeout=60,  # Large _bulk requests can take longer than 30s
                     max_retries=3,
                     retry_on_timeout=True
                 )
@@ -66,8 +110,8 @@ class QuantaSearchClient:
             except Exception as e:
                 logger.warning(f"Connection attempt {attempt}/{self.max_retries} failed: {e}")
                 if attempt < self.max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    wait_time = backoff_delay(attempt)  # Exponential backoff with jitter
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Failed to connect to OpenSearch after {self.max_retries} attempts")
@@ -78,7 +122,8 @@ class QuantaSearchClient:
         SELF-HEALING: Ensure index exists, create if missing
         
         This method is called before ANY upsert or search operation
-        to guarantee the index is always available.
+        to guarantee the index is always available. A confirmed index is
+        cached for INDEX_CACHE_TTL seconds to skip the HEAD request.
         
         Args:
             index_name: Name of the index to check/create
@@ -86,10 +131,15 @@ class QuantaSearchClient:
         Returns:
             True if index exists or was created successfully
         """
+        checked_at = self._known_indices.get(index_name)
+        if checked_at is not None and time.monotonic() - checked_at < INDEX_CACHE_TTL:
+            return True
+        
         try:
             # Check if index exists
             if self.client.indices.exists(index=index_name):
-                logger.debug(f"Index '{index_name}' exists")
+                logger.debug("Index '{}' exists", index_name)
+                self._known_indices[index_name] = time.monotonic()
                 return True
             
             # Index doesn't exist - create it automatically
@@ -98,75 +148,232 @@ class QuantaSearchClient:
             # Import configuration
             from src.services.opensearch.index_config import get_index_config
             
-            index_config = get_index_config()
+            # Shard count is fixed at creation, so size it for the expected corpus
+            expected_docs = os.getenv('OPENSEARCH_EXPECTED_DOCS')
+            index_config = get_index_config(
+                expected_docs=int(expected_docs) if expected_docs else None
+            )
             
             # Create index
-            self.client.indices.create(
-                index=index_name,
-                body=index_config
-            )
+            from opensearchpy.exceptions import RequestError
+            try:
+                self.client.indices.create(
+                    index=index_name,
+                    body=index_config
+                )
+            except RequestError as e:
+                # Another caller created it between the exists check and now
+                if e.error != 'resource_already_exists_exception':
+                    raise
+                logger.debug("Index '{}' was created concurrently", index_name)
+                self._known_indices[index_name] = time.monotonic()
+                return True
             
             logger.info(f"✅ Auto-created index '{index_name}' with production mappings")
+            self._known_indices[index_name] = time.monotonic()
             return True
             
         except Exception as e:
             logger.error(f"Error ensuring index '{index_name}': {e}")
             return False
     
-    def upsert_paper(self, paper_data: Dict[str, Any], index_name: str = "arxiv-papers") -> bool:
+    def invalidate_index_cache(self, index_name: Optional[str] = None) -> None:
+        """
+        Forget cached index existence checks
+        
+        Call after deleting an index so the next operation recreates it.
+        
+        Args:
+            index_name: Index to forget (all indexes if None)
+        """
+        if index_name is None:
+            self._known_indices.clear()
+        else:
+            self._known_indices.pop(index_name, None)
+    
+    @staticmethod
+    def _build_document(paper_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the OpenSearch document for a paper
+        
+        Args:
+            paper_data: Paper metadata and content
+        
+        Returns:
+            Document body matching the arxiv-papers mapping
+        """
+        return {
+            'arxiv_id': paper_data['arxiv_id'],
+            'title': paper_data.get('title', ''),
+            'full_text': paper_data.get('full_text', ''),
+            'summary': paper_data.get('summary', ''),
+            'published_date': paper_data.get('published_date'),
+            'created_at': paper_data.get('created_at'),
+            'authors': paper_data.get('authors') or [],
+            'categories': paper_data.get('categories') or [],
+        }
+    
+    def upsert_paper(
+        self,
+        paper_data: Dict[str, Any],
+        index_name: str = "arxiv-papers",
+        refresh: bool = False
+    ) -> bool:
         """
         Upsert a paper to OpenSearch (with auto-bootstrapping)
         
+        Single-document wrapper around upsert_papers(); prefer that for
+        more than one paper. The paper becomes searchable on the next
+        scheduled refresh, or immediately with refresh=True.
+        
         Args:
             paper_data: Paper metadata and content
             index_name: Target index name
+            refresh: Force an index refresh after the write
         
         Returns:
             True if successful
         """
         try:
-            # SELF-HEALING: Ensure index exists before upserting
-            if not self._ensure_index(index_name):
-                raise Exception(f"Failed to ensure index '{index_name}' exists")
-            
             if 'arxiv_id' not in paper_data:
                 raise ValueError("paper_data must contain 'arxiv_id'")
             
-            arxiv_id = paper_data['arxiv_id']
-            
-            # Prepare document for indexing
-            document = {
-                'arxiv_id': arxiv_id,
-                'title': paper_data.get('title', ''),
-                'full_text': paper_data.get('full_text', ''),
-                'summary': paper_data.get('summary', ''),
-                'published_date': paper_data.get('published_date'),
-                'created_at': paper_data.get('created_at'),
-                'authors': paper_data.get('authors', []),
-                'categories': paper_data.get('categories', []),
-            }
-            
-            # Upsert document (use arxiv_id as document ID for idempotency)
-            response = self.client.index(
-                index=index_name,
-                id=arxiv_id,
-                body=document,
-                refresh=True  # Make immediately searchable
+            indexed = self.upsert_papers(
+                [paper_data],
+                index_name=index_name,
+                thread_count=1,
+                pause_refresh=False,
+                refresh=refresh
             )
-            
-            logger.info(f"Upserted paper '{arxiv_id}' to OpenSearch: {response['result']}")
-            return True
+            return indexed == 1
             
         except Exception as e:
             logger.error(f"Error upserting paper '{paper_data.get('arxiv_id')}': {e}")
             return False
     
+    def upsert_papers(
+        self,
+        papers: Iterable[Dict[str, Any]],
+        index_name: str = "arxiv-papers",
+        chunk_size: Optional[int] = None,
+        max_chunk_bytes: Optional[int] = None,
+        thread_count: Optional[int] = None,
+        pause_refresh: bool = True,
+        refresh: bool = True,
+        raise_on_error: bool = False
+    ) -> int:
+        """
+        Bulk upsert papers to OpenSearch (with auto-bootstrapping)
+        
+        Sends papers in _bulk requests of chunk_size documents from
+        thread_count threads, without per-request refreshes; a single
+        refresh runs at the end unless refresh=False.
+        
+        Args:
+            papers: Paper metadata and content (any iterable, consumed lazily)
+            index_name: Target index name
+            chunk_size: Documents per _bulk request (defaults to QUANTA_BULK_CHUNK)
+            max_chunk_bytes: Byte cap per _bulk request, measured on the encoded
+                actions (a request is sent at whichever of chunk_size /
+                max_chunk_bytes is reached first; defaults to QUANTA_BULK_MAX_BYTES)
+            thread_count: Parallel _bulk sender threads, 1 sends sequentially
+                (defaults to QUANTA_BULK_THREADS, else min(CPU count, 4))
+            pause_refresh: Apply bulk-load index settings (no refresh, async
+                translog) during the load and restore them afterwards
+            refresh: Refresh the index once after the load
+            raise_on_error: Raise BulkIndexError on the first rejected
+                document instead of logging and counting it
+        
+        Returns:
+            Number of papers indexed successfully
+        """
+        from opensearchpy.helpers import parallel_bulk, streaming_bulk
+        
+        chunk_size = chunk_size or BULK_CHUNK_SIZE
+        max_chunk_bytes = max_chunk_bytes or BULK_MAX_CHUNK_BYTES
+        thread_count = thread_count or BULK_THREADS
+        
+        # SELF-HEALING: Ensure index exists before upserting
+        if not self._ensure_index(index_name):
+            raise Exception(f"Failed to ensure index '{index_name}' exists")
+        
+        # Use arxiv_id as document ID for idempotency
+        actions = (
+            {
+                '_op_type': 'index',
+                '_index': index_name,
+                '_id': paper_data['arxiv_id'],
+                '_source': self._build_document(paper_data),
+            }
+            for paper_data in papers
+        )
+        
+        indexed = 0
+        failed = 0
+        
+        if thread_count > 1:
+            results = parallel_bulk(
+                self.client,
+                actions,
+                thread_count=thread_count,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                queue_size=2 * thread_count,  # Keep a chunk ready for every thread
+                raise_on_error=raise_on_error
+            )
+        else:
+            results = streaming_bulk(
+                self.client,
+                actions,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                raise_on_error=raise_on_error
+            )
+        
+        # Skip per-segment refreshes and per-request translog fsyncs while bulk loading
+        if pause_refresh:
+            self.client.indices.put_settings(
+                index=index_name,
+                body=get_bulk_load_settings()
+            )
+        try:
+            for ok, item in results:
+                if ok:
+                    indexed += 1
+                else:
+                    failed += 1
+                    logger.error(f"Failed to index paper: {item}")
+        finally:
+            if pause_refresh:
+                self.client.indices.put_settings(
+                    index=index_name,
+                    body=get_steady_state_settings()
+                )
+            # One refresh for the whole batch makes it searchable
+            if refresh:
+                self.refresh(index_name)
+        
+        logger.info(f"Bulk upserted {indexed} papers to OpenSearch ({failed} failed)")
+        return indexed
+    
+    def refresh(self, index_name: str = "arxiv-papers") -> None:
+        """
+        Make all writes to an index visible to search
+        
+        Args:
+            index_name: Index to refresh
+        """
+        self.client.indices.refresh(index=index_name)
+    
     def search(
         self,
         query_text: str,
         index_name: str = "arxiv-papers",
         limit: int = 5,
-        fields: List[str] = None
+        fields: List[str] = None,
+        authors: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        arxiv_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search papers using BM25 algorithm (with auto-bootstrapping)
@@ -175,13 +382,18 @@ class QuantaSearchClient:
             query_text: Search query
             index_name: Index to search
             limit: Maximum results to return
-            fields: Fields to search (defaults to ['full_text', 'title'])
+            fields: Fields to search, with optional ^boost (defaults to
+                ['title^3', 'summary^2', 'full_text']; use 'authors.text'
+                to match author names)
+            authors: Only return papers by any of these exact author names
+            categories: Only return papers in any of these categories (e.g. 'cs.CL')
+            arxiv_ids: Only return papers with these arxiv IDs
         
         Returns:
             List of matching papers with scores
         """
         if fields is None:
-            fields = ['full_text', 'title', 'summary']
+            fields = DEFAULT_SEARCH_FIELDS
         
         try:
             # SELF-HEALING: Ensure index exists before searching
@@ -189,24 +401,32 @@ class QuantaSearchClient:
                 logger.warning(f"Index '{index_name}' doesn't exist - returning empty results")
                 return []
             
+            # Exact-match predicates go in filter context: unscored and cacheable
+            filters = []
+            if authors:
+                filters.append({"terms": {"authors": authors}})
+            if categories:
+                filters.append({"terms": {"categories": categories}})
+            if arxiv_ids:
+                filters.append({"terms": {"arxiv_id": arxiv_ids}})
+            
             # BM25 multi-match query
             query = {
                 "size": limit,
+                "track_total_hits": False,  # Only top hits are returned, skip exact counting
                 "query": {
-                    "multi_match": {
-                        "query": query_text,
-                        "fields": fields,
-                        "type": "best_fields",  # BM25 scoring
-                        "operator": "or"
+                    "bool": {
+                        "must": {
+                            "multi_match": {
+                                "query": query_text,
+                                "fields": fields,
+                                **MULTI_MATCH_OPTIONS
+                            }
+                        },
+                        "filter": filters
                     }
                 },
-                "_source": [
-                    "arxiv_id",
-                    "title", 
-                    "summary",
-                    "published_date",
-                    "authors"
-                ]
+                "_source": SEARCH_SOURCE_FIELDS
             }
             
             response = self.client.search(
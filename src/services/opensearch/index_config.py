@@ -2,74 +2,191 @@
 OpenSearch index configuration for Quanta-RAG
 Defines the mapping for arxiv-papers index
 """
+import copy
+import math
+from typing import Optional
 
 # Index name
 ARXIV_PAPERS_INDEX = "arxiv-papers"
 
+# Shard sizing: average indexed size of one paper (full text + metadata) and
+# the primary shard size to aim for (30-50GB is the usual sweet spot)
+AVG_DOC_BYTES = 50_000
+TARGET_SHARD_BYTES = 40 * 1024**3
+
+# Refresh cadence outside bulk loads; ingest runs refresh explicitly when done
+STEADY_STATE_REFRESH_INTERVAL = "30s"
+
 # Index mapping configuration
+#
+# Stored fields use the best_compression (DEFLATE) codec instead of the default
+# LZ4: paper text and metadata compress markedly better, shrinking disk use and
+# the bytes read per fetched hit, at the cost of slightly more CPU on indexing,
+# merges and _source/stored-field reads. Postings and doc values are unaffected.
+# (zstd / zstd_no_dict are available from OpenSearch 2.9 via the custom-codecs
+# plugin if write CPU becomes the bottleneck.)
 ARXIV_PAPERS_MAPPING = {
     "settings": {
-        "number_of_shards": 1,
-        "number_of_replicas": 0,
+        "number_of_shards": 1,  # Overridden by get_index_config(expected_docs)
+        "number_of_replicas": 0,  # Single-node cluster: a replica could never be allocated
+        "codec": "best_compression",
+        "refresh_interval": STEADY_STATE_REFRESH_INTERVAL,  # Fewer tiny segments than the 1s default
+        "translog": {
+            "flush_threshold_size": "1gb"  # Fewer flushes during backfills (default 512mb)
+        },
         "analysis": {
             "analyzer": {
                 "default": {
                     "type": "standard"
                 }
+            },
+            "char_filter": {
+                "collapse_whitespace": {
+                    "type": "pattern_replace",  # arxiv titles often contain line breaks
+                    "pattern": "\\s+",
+                    "replacement": " "
+                }
+            },
+            "normalizer": {
+                "lowercase_normalizer": {
+                    "type": "custom",  # Case/accent/whitespace-insensitive exact matching
+                    "char_filter": ["collapse_whitespace"],
+                    "filter": ["lowercase", "asciifolding"]
+                }
             }
         }
     },
     "mappings": {
+        # full_text is indexed but not kept in _source: hits never return it,
+        # and PostgreSQL holds the canonical copy for re-indexing
+        "_source": {
+            "excludes": ["full_text"]
+        },
         "properties": {
             "arxiv_id": {
-                "type": "keyword"  # Exact match for paper IDs
+                "type": "keyword",  # Exact match for paper IDs
+                "store": True  # Retrievable via stored_fields without _source
             },
             "title": {
                 "type": "text",
                 "analyzer": "standard",  # Tokenization and lowercase
+                "store": True,
                 "fields": {
                     "keyword": {
-                        "type": "keyword",  # For exact title matching
-                        "ignore_above": 256
+                        "type": "keyword",  # For exact title matching / dedup via term query
+                        "ignore_above": 256,
+                        "normalizer": "lowercase_normalizer"
                     }
                 }
             },
             "full_text": {
                 "type": "text",
-                "analyzer": "standard"  # Main searchable field for BM25
+                "analyzer": "standard",  # Main searchable field for BM25
+                "index_options": "freqs"  # No positions: smaller postings, no phrase queries
             },
             "summary": {
                 "type": "text",
-                "analyzer": "standard"
+                "analyzer": "standard",
+                "index_options": "freqs"
             },
             "published_date": {
                 "type": "date",
-                "format": "strict_date_optional_time||epoch_millis"
+                "format": "strict_date_optional_time||epoch_millis",
+                "store": True
             },
             "created_at": {
                 "type": "date",
                 "format": "strict_date_optional_time||epoch_millis"
             },
             "authors": {
-                "type": "text",
-                "analyzer": "standard"
+                "type": "keyword",  # Exact-match author filters
+                "ignore_above": 1024,
+                "fields": {
+                    "text": {
+                        "type": "text",  # Full-text search on author names
+                        "analyzer": "standard",
+                        "index_options": "freqs"
+                    }
+                }
             },
             "categories": {
-                "type": "keyword"  # Array of category tags
+                "type": "keyword",  # Array of category tags
+                "index": True,  # search() filters on it with terms queries
+                "doc_values": True,
+                "eager_global_ordinals": True  # Built at refresh, not on the first terms agg
             }
         }
     }
 }
 
 
-def get_index_config() -> dict:
+def compute_shard_count(
+    expected_docs: int,
+    avg_doc_bytes: int = AVG_DOC_BYTES,
+    target_shard_bytes: int = TARGET_SHARD_BYTES
+) -> int:
+    """
+    Pick a primary shard count for the expected corpus size
+    
+    Args:
+        expected_docs: Number of papers the index is expected to hold
+        avg_doc_bytes: Average on-disk size of one indexed paper
+        target_shard_bytes: Desired size of each primary shard
+    
+    Returns:
+        Number of primary shards (at least 1)
+    """
+    return max(1, math.ceil(expected_docs * avg_doc_bytes / target_shard_bytes))
+
+
+def get_index_config(expected_docs: Optional[int] = None) -> dict:
     """
     Get the complete index configuration
     
+    Args:
+        expected_docs: Expected corpus size used to size the primary shards
+            (keeps the default of 1 shard if None)
+    
     Returns:
         Dictionary with index settings and mappings
     """
-    return ARXIV_PAPERS_MAPPING
+    config = copy.deepcopy(ARXIV_PAPERS_MAPPING)
+    if expected_docs is not None:
+        config["settings"]["number_of_shards"] = compute_shard_count(expected_docs)
+    return config
+
+
+def get_bulk_load_settings() -> dict:
+    """
+    Get dynamic index settings to apply for the duration of a bulk load
+    
+    Disables refreshes and fsyncs the translog asynchronously. Safe for
+    this index because every document can be re-indexed from PostgreSQL.
+    
+    Returns:
+        Body for indices.put_settings
+    """
+    return {
+        "index": {
+            "refresh_interval": "-1",
+            "translog.durability": "async"
+        }
+    }
+
+
+def get_steady_state_settings() -> dict:
+    """
+    Get dynamic index settings to restore after a bulk load
+    
+    Returns:
+        Body for indices.put_settings
+    """
+    return {
+        "index": {
+            "refresh_interval": STEADY_STATE_REFRESH_INTERVAL,
+            "translog.durability": "request"
+        }
+    }
 
 
 def get_index_name() -> str:
@@ -0,0 +1,43 @@
+"""
+Retry helpers for Quanta-RAG
+Exponential backoff with jitter shared by network clients
+"""
+
+import random
+from typing import Optional
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0, jitter: float = 1.0) -> float:
+    """
+    Compute how long to wait before retrying
+    
+    Args:
+        attempt: Number of the attempt that just failed (1-based)
+        base: Delay unit in seconds, doubled per attempt
+        cap: Upper bound on the exponential part
+        jitter: Maximum random seconds added, to spread out retries
+    
+    Returns:
+        Delay in seconds: min(cap, base * 2**attempt) + uniform(0, jitter)
+    """
+    return min(cap, base * 2 ** attempt) + random.uniform(0, jitter)
+
+
+def parse_retry_after(value: Optional[str], cap: float = 60.0) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds
+    
+    Args:
+        value: Raw header value (may be None)
+        cap: Upper bound on the returned delay
+    
+    Returns:
+        Delay in seconds, or None if missing or not a number (e.g. HTTP-date form)
+    """
+    if not value:
+        return None
+    
+    try:
+        return min(cap, max(0.0, float(value)))
+    except ValueError:
+        return None
@@ -7,11 +7,14 @@ Connects to PostgreSQL and verifies:
 3. Row count
 
 Usage:
-   python src/verify_pipeline.py
+   python src/verify_pipeline.py [--json] [--approximate-count]
 """
 
+import argparse
 import os
 import sys
+from typing import Tuple
+import orjson
 from loguru import logger
 
 # Add src to path
@@ -19,88 +22,218 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.database.session import DatabaseSession
 from src.database.models import Paper
-from sqlalchemy import inspect
+from sqlalchemy import func, inspect, select, text
 
 
-def verify_pipeline():
+def count_papers(session, approximate: bool = False) -> Tuple[int, bool]:
+    """
+    Count rows in the papers table
+    
+    Args:
+        session: Active database session
+        approximate: Read the planner estimate from pg_class instead of
+            scanning the table (falls back to an exact count if the table
+            has never been analyzed)
+    
+    Returns:
+        Tuple of (number of papers, whether the number is an estimate)
+    """
+    if approximate:
+        # to_regclass resolves the name through search_path, like the ORM does
+        estimate = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": Paper.__tablename__}
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return estimate, True
+    
+    return session.execute(select(func.count()).select_from(Paper)).scalar(), False
+
+
+def print_block(*lines: str) -> None:
+    """
+    Print several lines with a single write to stdout
+    
+    Args:
+        lines: Lines to print, in order
+    """
+    print("\n".join(lines))
+
+
+def print_result(success: bool) -> None:
+    """
+    Print the final result banner
+    
+    Args:
+        success: Whether every verification step passed
+    """
+    if success:
+        print_block(
+            "\n" + "="*60,
+            "Final Result: ✅ SUCCESS",
+            "="*60 + "\n",
+            "✅ Pipeline is ready to run!",
+            "   Next step: Trigger the DAG in Airflow UI"
+        )
+    else:
+        print_block(
+            "\n" + "="*60,
+            "Final Result: ❌ FAILED",
+            "="*60 + "\n",
+            "❌ Pipeline has issues that need to be fixed",
+            "   Action: Check error messages above"
+        )
+
+
+def _quiet(*args, **kwargs) -> None:
+    """Discard human-readable output (used in --json mode)"""
+
+
+def verify_pipeline(approximate_count: bool = False, as_json: bool = False):
     """
     Verify the pipeline setup and database status
+    
+    Args:
+        approximate_count: Report the estimated row count instead of an exact one
+        as_json: Skip the human-readable report and write a single JSON
+            object with the results to stdout instead
+    
+    Returns:
+        True if every check passed
     """
-    print("\n" + "="*60)
-    print("QUANTA-RAG PIPELINE VERIFICATION")
-    print("="*60 + "\n")
+    say = _quiet if as_json else print
+    say_block = _quiet if as_json else print_block
+    report = {
+        "success": True,
+        "db_connected": False,
+        "table_exists": None,
+        "papers_count": None,
+        "papers_count_approximate": False,
+        "sample": [],
+        "create_tables": None,
+        "errors": [],
+    }
+    
+    say_block(
+        "\n" + "="*60,
+        "QUANTA-RAG PIPELINE VERIFICATION",
+        "="*60 + "\n"
+    )
     
     success = True
+    tables_exist = False
     
     # Step 1: Test database connection
-    print("1. Testing database connection...")
+    say("1. Testing database connection...")
     try:
         DatabaseSession.initialize()
-        print("   ✅ Database connection: SUCCESS")
+        report["db_connected"] = True
+        say("   ✅ Database connection: SUCCESS")
     except Exception as e:
-        print(f"   ❌ Database connection: FAILED - {e}")
-        success = False
-        print("\n" + "="*60)
-        print("Final Result: ❌ FAILED")
-        print("="*60 + "\n")
-        return
+        say(f"   ❌ Database connection: FAILED - {e}")
+        report["success"] = False
+        report["errors"].append(f"connection: {e}")
+        if as_json:
+            write_json_report(report)
+        say_block(
+            "\n" + "="*60,
+            "Final Result: ❌ FAILED",
+            "="*60 + "\n"
+        )
+        return False
     
     # Step 2: Check if tables exist
-    print("\n2. Checking if 'papers' table exists...")
+    say("\n2. Checking if 'papers' table exists...")
     try:
         inspector = inspect(DatabaseSession._engine)
-        tables = inspector.get_table_names()
         
-        if 'papers' in tables:
-            print("   ✅ Table 'papers' status: EXISTS")
+        # Single catalog lookup; only list every table when diagnosing
+        tables_exist = inspector.has_table('papers')
+        report["table_exists"] = tables_exist
+        if tables_exist:
+            say("   ✅ Table 'papers' status: EXISTS")
         else:
-            print("   ❌ Table 'papers' status: MISSING")
-            print(f"   Available tables: {tables}")
+            report["tables"] = inspector.get_table_names()
+            say("   ❌ Table 'papers' status: MISSING")
+            say(f"   Available tables: {report['tables']}")
             success = False
     except Exception as e:
-        print(f"   ❌ Error checking tables: {e}")
+        say(f"   ❌ Error checking tables: {e}")
+        report["errors"].append(f"tables: {e}")
         success = False
     
     # Step 3: Count rows
-    print("\n3. Counting rows in 'papers' table...")
+    say("\n3. Counting rows in 'papers' table...")
     try:
         with DatabaseSession.session_scope() as session:
-            count = session.query(Paper).count()
-            print(f"   ✅ Row count: {count}")
+            count, estimated = count_papers(session, approximate=approximate_count)
+            report["papers_count"] = count
+            report["papers_count_approximate"] = estimated
+            label = "Row count (estimated)" if estimated else "Row count"
+            say(f"   ✅ {label}: {count}")
             
             if count > 0:
-                # Show sample papers
-                print("\n   Sample papers:")
-                papers = session.query(Paper).limit(3).all()
-                for paper in papers:
-                    print(f"     - {paper.arxiv_id}: {paper.title[:50]}...")
+                # Show sample papers (only the two columns printed, not full rows)
+                sample = session.query(Paper.arxiv_id, Paper.title).limit(3)
+                report["sample"] = [
+                    {"arxiv_id": arxiv_id, "title": title} for arxiv_id, title in sample
+                ]
+                say_block(
+                    "\n   Sample papers:",
+                    *(f"     - {paper['arxiv_id']}: {paper['title'][:50]}..." for paper in report["sample"])
+                )
     except Exception as e:
-        print(f"   ❌ Error counting rows: {e}")
+        say(f"   ❌ Error counting rows: {e}")
+        report["errors"].append(f"count: {e}")
         success = False
     
     # Step 4: Test database write capability
-    print("\n4. Testing database write capability...")
-    try:
-        DatabaseSession.create_tables()
-        print("   ✅ create_tables() executed successfully")
-    except Exception as e:
-        print(f"   ⚠️  Warning during create_tables: {e}")
+    say("\n4. Testing database write capability...")
+    if tables_exist:
+        report["create_tables"] = "skipped"
+        say("   ✅ Schema already present, skipping create_tables()")
+    else:
+        try:
+            DatabaseSession.create_tables()
+            report["create_tables"] = "ok"
+            say("   ✅ create_tables() executed successfully")
+        except Exception as e:
+            report["create_tables"] = f"warning: {e}"
+            say(f"   ⚠️  Warning during create_tables: {e}")
     
     # Final result
-    print("\n" + "="*60)
-    if success:
-        print("Final Result: ✅ SUCCESS")
-        print("="*60 + "\n")
-        print("✅ Pipeline is ready to run!")
-        print("   Next step: Trigger the DAG in Airflow UI")
+    report["success"] = success
+    if as_json:
+        write_json_report(report)
     else:
-        print("Final Result: ❌ FAILED")
-        print("="*60 + "\n")
-        print("❌ Pipeline has issues that need to be fixed")
-        print("   Action: Check error messages above")
+        print_result(success)
     
     return success
 
 
+def write_json_report(report: dict) -> None:
+    """
+    Write the verification report to stdout as one line of JSON
+    
+    Args:
+        report: Results collected by verify_pipeline()
+    """
+    sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.flush()
+
+
 if __name__ == "__main__":
-    verify_pipeline()
+    parser = argparse.ArgumentParser(description="Verify the Quanta-RAG pipeline setup")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write the results as a single JSON object instead of a report"
+    )
+    parser.add_argument(
+        "--approximate-count",
+        action="store_true",
+        help="Use the planner's row estimate instead of counting every row"
+    )
+    args = parser.parse_args()
+    
+    verify_pipeline(approximate_count=args.approximate_count, as_json=args.json)